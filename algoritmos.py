@@ -1,5 +1,14 @@
+import pickle
+import sys
 import time
 import threading
+from functools import partial
+
+try:
+    # Disponible desde Python 3.14
+    from concurrent.futures import InterpreterPoolExecutor
+except ImportError:
+    InterpreterPoolExecutor = None
 
 class AlgoritmoBusqueda:
     # === ALGORITMOS DE BÚSQUEDA ===
@@ -27,14 +36,26 @@ class AlgoritmoBusqueda:
         return -1
 
 
+class InstantaneaArreglo:
+    # === REFERENCIA COMPARTIDA AL ARREGLO DE TRABAJO ===
+    # El algoritmo publica su copia una sola vez; la interfaz la lee sin copiarla
+    __slots__ = ("arreglo",)
+    
+    def __init__(self):
+        self.arreglo = None
+
+
 class AlgoritmoOrdenamiento:
     # === ALGORITMOS DE ORDENAMIENTO ===
     
     @staticmethod
-    def burbuja(arr):
+    def burbuja(arr, instantanea=None):
         arr_copy = arr.copy()
         n = len(arr_copy)
         
+        if instantanea is not None:
+            instantanea.arreglo = arr_copy
+        
         for i in range(n):
             for j in range(0, n - i - 1):
                 if arr_copy[j] > arr_copy[j + 1]:
@@ -57,9 +78,12 @@ class AlgoritmoOrdenamiento:
         return AlgoritmoOrdenamiento.quicksort(menores) + iguales + AlgoritmoOrdenamiento.quicksort(mayores)
     
     @staticmethod
-    def insercion(arr):
+    def insercion(arr, instantanea=None):
         arr_copy = arr.copy()
         
+        if instantanea is not None:
+            instantanea.arreglo = arr_copy
+        
         for i in range(1, len(arr_copy)):
             clave = arr_copy[i]
             j = i - 1
@@ -73,17 +97,99 @@ class AlgoritmoOrdenamiento:
         return arr_copy
 
 
+class BackendEjecucion:
+    # === BACKENDS DE EJECUCIÓN PARALELA ===
+    
+    HILOS = "hilos"
+    SIN_GIL = "sin_gil"
+    SUBINTERPRETES = "subinterpretes"
+    
+    @staticmethod
+    def gil_desactivado():
+        # sys._is_gil_enabled solo existe desde Python 3.13
+        return not getattr(sys, "_is_gil_enabled", lambda: True)()
+    
+    @staticmethod
+    def subinterpretes_disponibles():
+        return InterpreterPoolExecutor is not None
+    
+    @staticmethod
+    def disponibles():
+        backends = [BackendEjecucion.HILOS]
+        if BackendEjecucion.gil_desactivado():
+            backends.append(BackendEjecucion.SIN_GIL)
+        if BackendEjecucion.subinterpretes_disponibles():
+            backends.append(BackendEjecucion.SUBINTERPRETES)
+        return backends
+    
+    @staticmethod
+    def mejor_disponible():
+        # Sin GIL los hilos ya corren en paralelo y no hay que copiar datos
+        if BackendEjecucion.gil_desactivado():
+            return BackendEjecucion.SIN_GIL
+        if BackendEjecucion.subinterpretes_disponibles():
+            return BackendEjecucion.SUBINTERPRETES
+        return BackendEjecucion.HILOS
+    
+    @staticmethod
+    def resolver(solicitado):
+        # === BACKEND EFECTIVO CON RETROCESO A HILOS ===
+        if solicitado not in (BackendEjecucion.HILOS, BackendEjecucion.SIN_GIL,
+                              BackendEjecucion.SUBINTERPRETES):
+            raise ValueError(f"Backend desconocido: {solicitado}")
+        if solicitado not in BackendEjecucion.disponibles():
+            return BackendEjecucion.HILOS
+        return solicitado
+
+
+def _cronometrar(funcion, arr):
+    # A nivel de módulo para poder enviarla a un subintérprete
+    inicio = time.perf_counter()
+    inicio_cpu = time.thread_time()
+    resultado = funcion(arr)
+    fin_cpu = time.thread_time()
+    fin = time.perf_counter()
+    return resultado, inicio, fin, fin_cpu - inicio_cpu
+
+
+def _es_transferible(funcion):
+    # Los subintérpretes solo aceptan funciones serializables por referencia
+    # Una instantánea viajaría como copia y la interfaz nunca vería el arreglo de trabajo
+    if isinstance(funcion, partial) and any(
+        isinstance(valor, InstantaneaArreglo)
+        for valor in (*funcion.args, *funcion.keywords.values())
+    ):
+        return False
+    
+    try:
+        pickle.dumps(funcion)
+        return True
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+
 class EjecutorAlgoritmo:
     # === EJECUTOR CON MEDICIÓN DE TIEMPO ===
     
-    def __init__(self, nombre, funcion, arr, callback=None, callback_progreso=None):
+    def __init__(self, nombre, funcion, arr, callback=None, callback_progreso=None,
+                 verificador=None, callback_verificacion=None, backend=BackendEjecucion.HILOS):
         self.nombre = nombre
         self.funcion = funcion
         self.arr = arr
+        self.backend = BackendEjecucion.resolver(backend)
+        if self.backend == BackendEjecucion.SUBINTERPRETES and not _es_transferible(funcion):
+            self.backend = BackendEjecucion.HILOS
         self.callback = callback
         self.callback_progreso = callback_progreso
+        self.verificador = verificador
+        self.callback_verificacion = callback_verificacion
         self.tiempo = 0
+        self.inicio = 0
+        self.fin = 0
+        self.tiempo_cpu = 0
         self.resultado = None
+        self.verificado = None
+        self.mensaje_verificacion = ""
         self.thread = None
         self.completado = False
         self.progreso_actual = 0
@@ -93,10 +199,29 @@ class EjecutorAlgoritmo:
         self.thread.start()
     
     def _run(self):
-        inicio = time.perf_counter()
-        self.resultado = self.funcion(self.arr)
-        fin = time.perf_counter()
-        self.tiempo = fin - inicio
+        medicion = None
+        if self.backend == BackendEjecucion.SUBINTERPRETES:
+            try:
+                # El intérprete se crea antes de entrar a la región cronometrada
+                with InterpreterPoolExecutor(max_workers=1) as pool:
+                    medicion = pool.submit(_cronometrar, self.funcion, self.arr).result()
+            except Exception:
+                # Fallo del subintérprete (importación, serialización, el propio pool):
+                # se repite con hilos en lugar de perder al competidor
+                self.backend = BackendEjecucion.HILOS
+        
+        if medicion is None:
+            medicion = _cronometrar(self.funcion, self.arr)
+        self.resultado, self.inicio, self.fin, self.tiempo_cpu = medicion
+        self.tiempo = self.fin - self.inicio
+        
+        # === VERIFICACIÓN FUERA DE LA REGIÓN CRONOMETRADA ===
+        # Corre en el hilo del propio competidor, en paralelo con los que siguen
+        if self.verificador:
+            self.verificado, self.mensaje_verificacion = self.verificador(self.resultado)
+            if self.callback_verificacion:
+                self.callback_verificacion(self.nombre, self.verificado, self.mensaje_verificacion)
+        
         self.completado = True
         self.progreso_actual = 100
         
@@ -1,26 +1,35 @@
 import threading
 import time
-from algoritmos import AlgoritmoOrdenamiento, AlgoritmoBusqueda, EjecutorAlgoritmo
+from functools import partial
+from algoritmos import AlgoritmoOrdenamiento, AlgoritmoBusqueda, EjecutorAlgoritmo, BackendEjecucion, InstantaneaArreglo
 from utils import obtener_uso_memoria
+from verificacion import VerificadorResultados
 
 
 class CarreraAlgoritmos:
     # === GESTIÓN DE CARRERA DE ALGORITMOS PARALELOS ===
     
-    def __init__(self, arreglo, callback_progreso=None, callback_completo=None, callback_progreso_tiempo_real=None):
+    def __init__(self, arreglo, callback_progreso=None, callback_completo=None, callback_progreso_tiempo_real=None,
+                 backend=BackendEjecucion.HILOS):
         self.arreglo = arreglo
+        self.backend = backend
         self.callback_progreso = callback_progreso
         self.callback_completo = callback_completo
         self.callback_progreso_tiempo_real = callback_progreso_tiempo_real
         self.ejecutores = []
         self.resultados = {}
+        self.descalificados = {}
+        self.instantaneas = {}
         self.memoria_inicial = 0
         self.memoria_final = 0
+        self.tiempo_total = 0
+        self.aceleracion = 0
         self.en_ejecucion = False
     
     def preparar_carrera(self, incluir_busqueda=False, objetivo_busqueda=None, solo_busqueda=False):
         # === PREPARACIÓN DE ALGORITMOS PARA EJECUCIÓN ===
         algoritmos = []
+        self.instantaneas = {}
         
         if solo_busqueda:
             if objetivo_busqueda is not None:
@@ -35,15 +44,34 @@ class CarreraAlgoritmos:
                     # Búsqueda binaria en arreglo ordenado
                     return AlgoritmoBusqueda.busqueda_binaria(arr_ordenado, objetivo_busqueda)
                 
+                verificar_busqueda = VerificadorResultados.para_busqueda(arr_ordenado, objetivo_busqueda)
+                
                 algoritmos = [
-                    ("Búsqueda Secuencial", busqueda_sec_wrapper),
-                    ("Búsqueda Binaria", busqueda_bin_wrapper),
+                    ("Búsqueda Secuencial", busqueda_sec_wrapper, verificar_busqueda),
+                    ("Búsqueda Binaria", busqueda_bin_wrapper, verificar_busqueda),
                 ]
         else:
+            verificar_orden = VerificadorResultados.para_ordenamiento(self.arreglo)
+            
+            # === INSTANTÁNEAS PARA LA VISUALIZACIÓN ===
+            # QuickSort no ordena en el lugar: solo se ve su resultado final
+            self.instantaneas = {
+                nombre: InstantaneaArreglo() for nombre in ("Burbuja", "QuickSort", "Inserción")
+            }
+            
+            burbuja = AlgoritmoOrdenamiento.burbuja
+            insercion = AlgoritmoOrdenamiento.insercion
+            # Solo se comparte el arreglo de trabajo dentro del mismo intérprete; con
+            # subintérpretes se muestran la entrada y los resultados finales, sin
+            # obligar a ningún competidor a volver a los hilos
+            if BackendEjecucion.resolver(self.backend) != BackendEjecucion.SUBINTERPRETES:
+                burbuja = partial(burbuja, instantanea=self.instantaneas["Burbuja"])
+                insercion = partial(insercion, instantanea=self.instantaneas["Inserción"])
+            
             algoritmos = [
-                ("Burbuja", AlgoritmoOrdenamiento.burbuja),
-                ("QuickSort", AlgoritmoOrdenamiento.quicksort),
-                ("Inserción", AlgoritmoOrdenamiento.insercion),
+                ("Burbuja", burbuja, verificar_orden),
+                ("QuickSort", AlgoritmoOrdenamiento.quicksort, verificar_orden),
+                ("Inserción", insercion, verificar_orden),
             ]
             
             if incluir_busqueda and objetivo_busqueda is not None:
@@ -55,19 +83,24 @@ class CarreraAlgoritmos:
                 def busqueda_bin_wrapper(arr):
                     return AlgoritmoBusqueda.busqueda_binaria(arr_ordenado, objetivo_busqueda)
                 
+                verificar_busqueda = VerificadorResultados.para_busqueda(arr_ordenado, objetivo_busqueda)
+                
                 algoritmos.extend([
-                    ("Búsqueda Secuencial", busqueda_sec_wrapper),
-                    ("Búsqueda Binaria", busqueda_bin_wrapper),
+                    ("Búsqueda Secuencial", busqueda_sec_wrapper, verificar_busqueda),
+                    ("Búsqueda Binaria", busqueda_bin_wrapper, verificar_busqueda),
                 ])
         
         self.ejecutores = []
-        for nombre, funcion in algoritmos:
+        for nombre, funcion, verificador in algoritmos:
             ejecutor = EjecutorAlgoritmo(
                 nombre=nombre,
                 funcion=funcion,
                 arr=self.arreglo,
                 callback=self._on_algoritmo_completo,
-                callback_progreso=self._on_progreso_tiempo_real
+                callback_progreso=self._on_progreso_tiempo_real,
+                verificador=verificador,
+                callback_verificacion=self._on_verificacion,
+                backend=self.backend
             )
             self.ejecutores.append(ejecutor)
     
@@ -78,6 +111,7 @@ class CarreraAlgoritmos:
         
         self.en_ejecucion = True
         self.resultados = {}
+        self.descalificados = {}
         self.memoria_inicial = obtener_uso_memoria()
         
         for ejecutor in self.ejecutores:
@@ -90,9 +124,18 @@ class CarreraAlgoritmos:
         # === REGISTRO DE RESULTADO INDIVIDUAL ===
         self.resultados[nombre] = tiempo
         
+        if nombre in self.instantaneas:
+            ejecutor = next(e for e in self.ejecutores if e.nombre == nombre)
+            self.instantaneas[nombre].arreglo = ejecutor.resultado
+        
         if self.callback_progreso:
             self.callback_progreso(nombre, tiempo, len(self.resultados))
     
+    def _on_verificacion(self, nombre, valido, mensaje):
+        # === REGISTRO DE COMPETIDORES CON RESULTADO INCORRECTO ===
+        if not valido:
+            self.descalificados[nombre] = mensaje
+    
     def _on_progreso_tiempo_real(self, nombre, progreso):
         if self.callback_progreso_tiempo_real:
             self.callback_progreso_tiempo_real(nombre, progreso)
@@ -103,12 +146,10 @@ class CarreraAlgoritmos:
             ejecutor.esperar()
         
         self.memoria_final = obtener_uso_memoria()
+        self._calcular_aceleracion()
         self.en_ejecucion = False
         
-        resultados_ordenados = sorted(
-            self.resultados.items(),
-            key=lambda x: x[1]
-        )
+        resultados_ordenados = self.obtener_clasificacion()
         
         if self.callback_completo:
             self.callback_completo(
@@ -116,13 +157,56 @@ class CarreraAlgoritmos:
                 self.memoria_final - self.memoria_inicial
             )
     
+    def _calcular_aceleracion(self):
+        # === ACELERACIÓN PARALELA MEDIDA ===
+        # Tiempo de CPU de todos los competidores frente al tiempo de pared;
+        # con el GIL activo ronda 1x aunque los competidores corran en hilos.
+        # Un competidor que lanzó una excepción no tiene marcas de tiempo válidas
+        completados = [ejecutor for ejecutor in self.ejecutores if ejecutor.completado]
+        if not completados:
+            self.tiempo_total = 0
+            self.aceleracion = 0
+            return
+        
+        self.tiempo_total = (
+            max(ejecutor.fin for ejecutor in completados)
+            - min(ejecutor.inicio for ejecutor in completados)
+        )
+        suma_cpu = sum(ejecutor.tiempo_cpu for ejecutor in completados)
+        self.aceleracion = suma_cpu / self.tiempo_total if self.tiempo_total > 0 else 0
+    
+    def obtener_instantanea(self):
+        # === ARREGLO A VISUALIZAR EN ESTE MOMENTO ===
+        # Durante la carrera, el primer competidor pendiente que haya publicado su arreglo;
+        # al terminar, el resultado del ganador
+        for ejecutor in self.ejecutores:
+            instantanea = self.instantaneas.get(ejecutor.nombre)
+            if instantanea and instantanea.arreglo is not None and not ejecutor.completado:
+                return ejecutor.nombre, instantanea.arreglo
+        
+        ganador = self.obtener_ganador()
+        if ganador and ganador[0] in self.instantaneas:
+            return ganador[0], self.instantaneas[ganador[0]].arreglo
+        
+        return None, self.arreglo
+    
+    def obtener_backends(self):
+        # === BACKEND EFECTIVO DE CADA COMPETIDOR ===
+        return {ejecutor.nombre: ejecutor.backend for ejecutor in self.ejecutores}
+    
     def obtener_ganador(self):
         # === OBTENCIÓN DEL ALGORITMO MÁS RÁPIDO ===
-        if not self.resultados:
+        clasificacion = self.obtener_clasificacion()
+        if not clasificacion:
             return None
         
-        return min(self.resultados.items(), key=lambda x: x[1])
+        return clasificacion[0]
     
     def obtener_clasificacion(self):
         # === OBTENCIÓN DE CLASIFICACIÓN COMPLETA ===
-        return sorted(self.resultados.items(), key=lambda x: x[1])
\ No newline at end of file
+        # Solo compiten los resultados que superaron la verificación
+        validos = [
+            (nombre, tiempo) for nombre, tiempo in self.resultados.items()
+            if nombre not in self.descalificados
+        ]
+        return sorted(validos, key=lambda x: x[1])
\ No newline at end of file
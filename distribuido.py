@@ -0,0 +1,514 @@
+import argparse
+import itertools
+import multiprocessing
+import os
+import random
+import socket
+import threading
+import time
+from collections import deque
+from multiprocessing.connection import Client, Listener
+
+from algoritmos import AlgoritmoOrdenamiento, AlgoritmoBusqueda, EjecutorAlgoritmo
+from utils import generar_arreglo, formatear_tiempo
+from verificacion import VerificadorResultados
+
+# === COMPETIDORES DISPONIBLES PARA LOS TRABAJADORES ===
+# Los trabajos viajan por nombre; cada trabajador resuelve la función localmente
+COMPETIDORES_ORDENAMIENTO = {
+    "Burbuja": AlgoritmoOrdenamiento.burbuja,
+    "QuickSort": AlgoritmoOrdenamiento.quicksort,
+    "Inserción": AlgoritmoOrdenamiento.insercion,
+}
+
+COMPETIDORES_BUSQUEDA = {
+    "Búsqueda Secuencial": AlgoritmoBusqueda.busqueda_secuencial,
+    "Búsqueda Binaria": AlgoritmoBusqueda.busqueda_binaria,
+}
+
+INTERVALO_LATIDO = 1.0
+LIMITE_LATIDO = 5.0
+# Trabajadores perdidos ejecutando un mismo trabajo antes de darlo por fallido
+MAX_INTENTOS = 3
+# Cada cuánto revisa una conexión abierta si el coordinador se detuvo
+INTERVALO_CONEXION = 0.2
+
+# Únicos métodos del estado que un trabajador puede invocar por la red
+METODOS_REMOTOS = {"registrar", "latido", "tomar", "entregar", "esta_detenido"}
+
+
+class _EstadoCoordinador:
+    # === ESTADO COMPARTIDO DEL COORDINADOR ===
+    # Vive en el proceso coordinador; los trabajadores lo usan a través de _ClienteEstado
+
+    def __init__(self, max_intentos=MAX_INTENTOS):
+        self.lock = threading.Lock()
+        self.max_intentos = max_intentos
+        self.pendientes = deque()
+        self.en_curso = {}
+        self.intentos = {}
+        self.latidos = {}
+        self.resultados = []
+        self.completados = set()
+        self.detenido = False
+
+    def agregar(self, trabajo):
+        with self.lock:
+            self.pendientes.append(trabajo)
+
+    def registrar(self, trabajador):
+        with self.lock:
+            self.latidos[trabajador] = time.monotonic()
+
+    def latido(self, trabajador):
+        self.registrar(trabajador)
+
+    def tomar(self, trabajador):
+        with self.lock:
+            self.latidos[trabajador] = time.monotonic()
+            if self.detenido or not self.pendientes:
+                return None
+            trabajo = self.pendientes.popleft()
+            self.en_curso[trabajo["id"]] = (trabajador, trabajo)
+            return trabajo
+
+    def entregar(self, trabajador, resultado):
+        with self.lock:
+            self.latidos[trabajador] = time.monotonic()
+            self.en_curso.pop(resultado["id"], None)
+            # Un trabajo reasignado puede llegar dos veces; solo cuenta el primero
+            if resultado["id"] in self.completados:
+                return
+            self.completados.add(resultado["id"])
+            self.resultados.append(resultado)
+
+    def revisar_perdidos(self, limite):
+        # === REASIGNACIÓN DE TRABAJOS DE TRABAJADORES CAÍDOS ===
+        ahora = time.monotonic()
+        with self.lock:
+            perdidos = [t for t, ultimo in self.latidos.items() if ahora - ultimo > limite]
+            for trabajador in perdidos:
+                del self.latidos[trabajador]
+            for id_trabajo, (trabajador, trabajo) in list(self.en_curso.items()):
+                if trabajador not in perdidos:
+                    continue
+                del self.en_curso[id_trabajo]
+                self.intentos[id_trabajo] = self.intentos.get(id_trabajo, 0) + 1
+                # Un trabajo que tumba a su trabajador (memoria, segfault) no debe
+                # pasar por toda la flota: tras max_intentos se registra como fallido
+                if self.intentos[id_trabajo] >= self.max_intentos:
+                    self.completados.add(id_trabajo)
+                    self.resultados.append(_resultado_fallido(
+                        trabajo, trabajador,
+                        f"Abandonado tras perder {self.intentos[id_trabajo]} trabajadores"
+                    ))
+                else:
+                    self.pendientes.appendleft(trabajo)
+            return perdidos
+
+    def trabajadores_activos(self):
+        with self.lock:
+            return list(self.latidos)
+
+    def obtener_resultados(self, desde=0):
+        with self.lock:
+            return self.resultados[desde:]
+
+    def trabajos_restantes(self):
+        with self.lock:
+            return len(self.pendientes) + len(self.en_curso)
+
+    def detener(self):
+        with self.lock:
+            self.detenido = True
+
+    def esta_detenido(self):
+        return self.detenido
+
+
+class _ClienteEstado:
+    # === ACCESO REMOTO AL ESTADO DEL COORDINADOR ===
+    # Una sola conexión compartida por el bucle del trabajador y su hilo de latidos
+
+    def __init__(self, direccion, clave):
+        self.conexion = Client(tuple(direccion), authkey=clave)
+        self.lock = threading.Lock()
+
+    def _llamar(self, metodo, *args):
+        # EOFError/OSError se propagan: significan que el coordinador se cerró
+        with self.lock:
+            self.conexion.send((metodo, args))
+            correcto, valor = self.conexion.recv()
+        if not correcto:
+            raise RuntimeError(f"El coordinador rechazó {metodo}: {valor}")
+        return valor
+
+    def registrar(self, trabajador):
+        return self._llamar("registrar", trabajador)
+
+    def latido(self, trabajador):
+        return self._llamar("latido", trabajador)
+
+    def tomar(self, trabajador):
+        return self._llamar("tomar", trabajador)
+
+    def entregar(self, trabajador, resultado):
+        return self._llamar("entregar", trabajador, resultado)
+
+    def esta_detenido(self):
+        return self._llamar("esta_detenido")
+
+    def cerrar(self):
+        with self.lock:
+            self.conexion.close()
+
+
+class CoordinadorCarrera:
+    # === COORDINADOR DE CARRERAS DISTRIBUIDAS ===
+
+    def __init__(self, direccion=("127.0.0.1", 0), clave=b"carrera", limite_latido=LIMITE_LATIDO,
+                 max_intentos=MAX_INTENTOS):
+        self.clave = clave
+        self.limite_latido = limite_latido
+        self.estado = _EstadoCoordinador(max_intentos)
+        self.contador = itertools.count()
+        self.trabajadores_perdidos = []
+
+        self.listener = Listener(direccion, authkey=clave)
+        self.direccion = self.listener.address
+        self.hilo_servidor = None
+        self.servidor_detenido = threading.Event()
+
+    def iniciar(self):
+        self.hilo_servidor = threading.Thread(target=self._atender_conexiones, daemon=True)
+        self.hilo_servidor.start()
+
+    def _atender_conexiones(self):
+        # === BUCLE DE ACEPTACIÓN DEL SERVIDOR ===
+        # Termina y libera el puerto al detener
+        while not self.servidor_detenido.is_set():
+            try:
+                conexion = self.listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError):
+                # Clave incorrecta, cliente que cortó el saludo o la conexión vacía de detener
+                continue
+            if self.servidor_detenido.is_set():
+                conexion.close()
+                break
+            threading.Thread(target=self._atender_trabajador, args=(conexion,), daemon=True).start()
+
+        self.listener.close()
+
+    def _atender_trabajador(self, conexion):
+        # === PETICIONES DE UN TRABAJADOR CONECTADO ===
+        # Cada petición es (método, argumentos); la respuesta, (correcto, valor)
+        with conexion:
+            while not self.servidor_detenido.is_set():
+                try:
+                    if not conexion.poll(INTERVALO_CONEXION):
+                        continue
+                    metodo, args = conexion.recv()
+                except (EOFError, OSError):
+                    return
+
+                if metodo not in METODOS_REMOTOS:
+                    respuesta = (False, f"Método no permitido: {metodo}")
+                else:
+                    try:
+                        respuesta = (True, getattr(self.estado, metodo)(*args))
+                    except Exception as error:
+                        respuesta = (False, repr(error))
+
+                try:
+                    conexion.send(respuesta)
+                except (EOFError, OSError):
+                    return
+
+    def agregar_trabajo(self, competidor, tamanio, semilla):
+        if competidor not in COMPETIDORES_ORDENAMIENTO and competidor not in COMPETIDORES_BUSQUEDA:
+            raise ValueError(f"Competidor desconocido: {competidor}")
+        if tamanio <= 0:
+            raise ValueError(f"Tamaño inválido: {tamanio}")
+
+        trabajo = {
+            "id": next(self.contador),
+            "competidor": competidor,
+            "tamanio": tamanio,
+            "semilla": semilla,
+        }
+        self.estado.agregar(trabajo)
+        return trabajo["id"]
+
+    def agregar_barrido(self, competidores, tamanios, semillas):
+        # === PRODUCTO CARTESIANO DE COMPETIDORES, TAMAÑOS Y SEMILLAS ===
+        return [
+            self.agregar_trabajo(competidor, tamanio, semilla)
+            for tamanio in tamanios
+            for semilla in semillas
+            for competidor in competidores
+        ]
+
+    def esperar_resultados(self, callback_resultado=None, timeout=None, intervalo=0.1,
+                           espera_sin_trabajadores=None, callback_aviso=None):
+        # === RECEPCIÓN CONTINUA DE RESULTADOS ===
+        # Sin trabajadores activos y con trabajos pendientes, avisa tras limite_latido
+        # y, si se indica espera_sin_trabajadores, deja de esperar pasado ese tiempo
+        inicio = time.monotonic()
+        recibidos = 0
+        sin_trabajadores_desde = None
+        avisado = False
+
+        while True:
+            self.trabajadores_perdidos.extend(self.estado.revisar_perdidos(self.limite_latido))
+
+            nuevos = self.estado.obtener_resultados(recibidos)
+            recibidos += len(nuevos)
+            if callback_resultado:
+                for resultado in nuevos:
+                    callback_resultado(resultado)
+
+            if self.estado.trabajos_restantes() == 0:
+                break
+            if timeout is not None and time.monotonic() - inicio > timeout:
+                break
+
+            if self.estado.trabajadores_activos():
+                sin_trabajadores_desde = None
+                avisado = False
+            else:
+                ahora = time.monotonic()
+                sin_trabajadores_desde = sin_trabajadores_desde or ahora
+                if not avisado and ahora - sin_trabajadores_desde > self.limite_latido:
+                    avisado = True
+                    if callback_aviso:
+                        callback_aviso(f"Sin trabajadores activos; "
+                                       f"{self.estado.trabajos_restantes()} trabajos pendientes")
+                if (espera_sin_trabajadores is not None
+                        and ahora - sin_trabajadores_desde > espera_sin_trabajadores):
+                    break
+
+            time.sleep(intervalo)
+
+        return self.estado.obtener_resultados()
+
+    def resumen(self):
+        # === AGREGACIÓN POR COMPETIDOR Y TAMAÑO ===
+        tiempos = {}
+        for resultado in self.estado.obtener_resultados():
+            if not resultado["verificado"]:
+                continue
+            clave = (resultado["competidor"], resultado["tamanio"])
+            tiempos.setdefault(clave, []).append(resultado["tiempo"])
+
+        return {
+            clave: {
+                "ejecuciones": len(valores),
+                "minimo": min(valores),
+                "promedio": sum(valores) / len(valores),
+                "maximo": max(valores),
+            }
+            for clave, valores in sorted(tiempos.items())
+        }
+
+    def detener(self):
+        # Los trabajadores terminan al ver el estado detenido o al perder la conexión
+        self.estado.detener()
+
+        if self.hilo_servidor is None:
+            self.listener.close()
+            return
+
+        # Las conexiones abiertas se cierran al notar el evento, y los trabajadores reciben EOFError
+        self.servidor_detenido.set()
+        # Una conexión vacía despierta al accept bloqueado
+        host, puerto = self.direccion
+        try:
+            socket.create_connection(("127.0.0.1" if host == "0.0.0.0" else host, puerto), timeout=1).close()
+        except OSError:
+            pass
+        self.hilo_servidor.join()
+        self.hilo_servidor = None
+
+
+def ejecutar_trabajo(trabajo, trabajador):
+    # === EJECUCIÓN LOCAL DE UN TRABAJO A PARTIR DE SU SEMILLA ===
+    arr = generar_arreglo(trabajo["tamanio"], semilla=trabajo["semilla"])
+    competidor = trabajo["competidor"]
+
+    if competidor in COMPETIDORES_ORDENAMIENTO:
+        funcion = COMPETIDORES_ORDENAMIENTO[competidor]
+        verificador = VerificadorResultados.para_ordenamiento(arr)
+    else:
+        busqueda = COMPETIDORES_BUSQUEDA[competidor]
+        arr_ordenado = sorted(arr)
+        objetivo = random.Random(trabajo["semilla"]).choice(arr)
+
+        def funcion(arr):
+            return busqueda(arr_ordenado, objetivo)
+
+        verificador = VerificadorResultados.para_busqueda(arr_ordenado, objetivo)
+
+    ejecutor = EjecutorAlgoritmo(competidor, funcion, arr, verificador=verificador)
+    ejecutor.ejecutar()
+    ejecutor.esperar()
+
+    # Si la función lanzó una excepción, el hilo del ejecutor terminó sin completar
+    if not ejecutor.completado:
+        return _resultado_fallido(trabajo, trabajador, "El competidor terminó con error")
+
+    return {
+        "id": trabajo["id"],
+        "trabajador": trabajador,
+        "competidor": competidor,
+        "tamanio": trabajo["tamanio"],
+        "semilla": trabajo["semilla"],
+        "tiempo": ejecutor.tiempo,
+        "verificado": ejecutor.verificado,
+        "mensaje": ejecutor.mensaje_verificacion,
+    }
+
+
+def _resultado_fallido(trabajo, trabajador, mensaje):
+    return {
+        "id": trabajo["id"],
+        "trabajador": trabajador,
+        "competidor": trabajo["competidor"],
+        "tamanio": trabajo["tamanio"],
+        "semilla": trabajo["semilla"],
+        "tiempo": None,
+        "verificado": False,
+        "mensaje": mensaje,
+    }
+
+
+def ejecutar_trabajador(direccion, clave=b"carrera", nombre=None, espera=0.2,
+                        intervalo_latido=INTERVALO_LATIDO):
+    # === BUCLE DE UN TRABAJADOR ===
+    estado = _ClienteEstado(direccion, clave)
+
+    nombre = nombre or f"{socket.gethostname()}-{os.getpid()}"
+    estado.registrar(nombre)
+
+    terminado = threading.Event()
+
+    def enviar_latidos():
+        # Mantiene vivo al trabajador mientras ejecuta trabajos largos
+        while not terminado.wait(intervalo_latido):
+            try:
+                estado.latido(nombre)
+            except (EOFError, OSError):
+                return
+
+    threading.Thread(target=enviar_latidos, daemon=True).start()
+
+    try:
+        while not estado.esta_detenido():
+            trabajo = estado.tomar(nombre)
+            if trabajo is None:
+                time.sleep(espera)
+                continue
+            try:
+                resultado = ejecutar_trabajo(trabajo, nombre)
+            except Exception as error:
+                # Un trabajo defectuoso se reporta como fallido en lugar de tumbar al trabajador,
+                # que si no lo reasignaría a toda la flota
+                resultado = _resultado_fallido(trabajo, nombre, f"Error: {error!r}")
+            estado.entregar(nombre, resultado)
+    except (EOFError, OSError):
+        # El coordinador se cerró
+        pass
+    finally:
+        terminado.set()
+        estado.cerrar()
+
+
+def iniciar_trabajadores_locales(direccion, clave=b"carrera", cantidad=None):
+    # === TRABAJADORES EN PROCESOS DE LA MÁQUINA LOCAL ===
+    cantidad = cantidad or os.cpu_count() or 1
+    # spawn: con fork el trabajador heredaría el socket y los hilos del servidor del coordinador
+    contexto = multiprocessing.get_context("spawn")
+    procesos = []
+    for i in range(cantidad):
+        proceso = contexto.Process(
+            target=ejecutar_trabajador,
+            args=(direccion, clave, f"local-{i}"),
+            daemon=True
+        )
+        proceso.start()
+        procesos.append(proceso)
+    return procesos
+
+
+def _parsear_direccion(texto):
+    host, puerto = texto.rsplit(":", 1)
+    return host, int(puerto)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Carrera de algoritmos distribuida")
+    subparsers = parser.add_subparsers(dest="modo", required=True)
+
+    coordinador = subparsers.add_parser("coordinador", help="Reparte trabajos y agrega resultados")
+    coordinador.add_argument("--direccion", default="0.0.0.0:50000")
+    coordinador.add_argument("--competidores", nargs="+",
+                             default=list(COMPETIDORES_ORDENAMIENTO) + list(COMPETIDORES_BUSQUEDA))
+    coordinador.add_argument("--tamanios", nargs="+", type=int, default=[1000, 5000])
+    coordinador.add_argument("--semillas", nargs="+", type=int, default=[1, 2, 3])
+    coordinador.add_argument("--trabajadores-locales", type=int, default=0)
+
+    trabajador = subparsers.add_parser("trabajador", help="Ejecuta trabajos del coordinador")
+    trabajador.add_argument("--direccion", required=True)
+    trabajador.add_argument("--nombre")
+
+    for sub in (coordinador, trabajador):
+        sub.add_argument("--clave", default="carrera")
+
+    args = parser.parse_args()
+    clave = args.clave.encode()
+
+    if args.modo == "trabajador":
+        ejecutar_trabajador(_parsear_direccion(args.direccion), clave, args.nombre)
+        return
+
+    coord = CoordinadorCarrera(_parsear_direccion(args.direccion), clave)
+    coord.iniciar()
+    coord.agregar_barrido(args.competidores, args.tamanios, args.semillas)
+    print(f"Coordinador escuchando en {coord.direccion[0]}:{coord.direccion[1]}")
+
+    procesos = []
+    if args.trabajadores_locales:
+        host = "127.0.0.1" if coord.direccion[0] == "0.0.0.0" else coord.direccion[0]
+        procesos = iniciar_trabajadores_locales((host, coord.direccion[1]), clave,
+                                                args.trabajadores_locales)
+
+    def mostrar(resultado):
+        estado = "✓" if resultado["verificado"] else "✗"
+        detalle = (formatear_tiempo(resultado["tiempo"]) if resultado["tiempo"] is not None
+                   else resultado["mensaje"])
+        print(f"{estado} [{resultado['trabajador']}] {resultado['competidor']} "
+              f"n={resultado['tamanio']} semilla={resultado['semilla']}: {detalle}")
+
+    # Con trabajadores locales no llegará nadie más si todos caen; los remotos pueden tardar en conectarse
+    espera = 2 * coord.limite_latido if procesos else None
+    coord.esperar_resultados(callback_resultado=mostrar, espera_sin_trabajadores=espera,
+                             callback_aviso=lambda aviso: print(f"AVISO: {aviso}"))
+    restantes = coord.estado.trabajos_restantes()
+    coord.detener()
+
+    if restantes:
+        print(f"\nTrabajos sin terminar: {restantes}")
+
+    if coord.trabajadores_perdidos:
+        print(f"\nTrabajadores perdidos: {', '.join(coord.trabajadores_perdidos)}")
+
+    print("\nRESUMEN:")
+    for (competidor, tamanio), datos in coord.resumen().items():
+        print(f"{competidor} n={tamanio}: promedio {formatear_tiempo(datos['promedio'])} "
+              f"(mín {formatear_tiempo(datos['minimo'])}, {datos['ejecuciones']} ejecuciones)")
+
+    for proceso in procesos:
+        proceso.join(timeout=5)
+
+
+if __name__ == "__main__":
+    main()
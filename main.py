@@ -4,6 +4,8 @@ import threading
 import time
 import random
 from carrera import CarreraAlgoritmos
+from algoritmos import BackendEjecucion
+from visualizacion import ResumenCubetas
 from utils import generar_arreglo, formatear_tiempo, formatear_memoria
 
 # === CONFIGURACIÓN DE COLORES ===
@@ -25,6 +27,10 @@ COLORES_ALGORITMOS = {
     "Búsqueda Binaria": "#f39c12",
 }
 
+# === REFRESCO DE LA VISUALIZACIÓN DEL ARREGLO ===
+# Limitado para no quitarle tiempo de CPU a los competidores
+INTERVALO_VISUALIZACION_MS = 250
+
 
 class BarraProgreso(tk.Canvas):
     def __init__(self, parent, nombre, color, **kwargs):
@@ -34,6 +40,7 @@ class BarraProgreso(tk.Canvas):
         self.progreso = 0
         self.tiempo = 0
         self.completado = False
+        self.descalificado = False
         
         self.width = kwargs.get('width', 400)
         self.height = kwargs.get('height', 60)
@@ -63,7 +70,10 @@ class BarraProgreso(tk.Canvas):
             anchor="w"
         )
         
-        if self.completado:
+        if self.completado and self.descalificado:
+            tiempo_texto = f"✗ Resultado incorrecto ({formatear_tiempo(self.tiempo)})"
+            color_texto = COLOR_PRIMARY
+        elif self.completado:
             tiempo_texto = f"✓ {formatear_tiempo(self.tiempo)}"
             color_texto = COLOR_SUCCESS
         elif self.progreso > 0:
@@ -81,21 +91,51 @@ class BarraProgreso(tk.Canvas):
             anchor="e"
         )
     
-    def actualizar(self, progreso=None, tiempo=None, completado=False):
+    def actualizar(self, progreso=None, tiempo=None, completado=False, descalificado=False):
         if progreso is not None:
             self.progreso = min(progreso, 100)
         if tiempo is not None:
             self.tiempo = tiempo
         self.completado = completado
+        self.descalificado = descalificado
         self.dibujar()
     
     def reset(self):
         self.progreso = 0
         self.tiempo = 0
         self.completado = False
+        self.descalificado = False
         self.dibujar()
 
 
+class VisualizadorArreglo(tk.Canvas):
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, bg=COLOR_PANEL, highlightthickness=0, **kwargs)
+        
+        self.width = kwargs.get('width', 230)
+        self.height = kwargs.get('height', 80)
+        
+        # Una cubeta cada dos píxeles: el costo de dibujo no depende del tamaño del arreglo
+        self.resumen = ResumenCubetas(num_cubetas=(self.width - 10) // 2)
+    
+    def dibujar(self, arr, color=COLOR_SUCCESS):
+        self.delete("all")
+        
+        if not arr:
+            return
+        
+        self.resumen.actualizar(arr)
+        valor_min, valor_max = self.resumen.rango()
+        escala = (self.height - 10) / ((valor_max - valor_min) or 1)
+        ancho_cubeta = (self.width - 10) / len(self.resumen.minimos)
+        
+        for i, (minimo, maximo) in enumerate(zip(self.resumen.minimos, self.resumen.maximos)):
+            x = 5 + i * ancho_cubeta
+            y_min = self.height - 5 - (minimo - valor_min) * escala
+            y_max = self.height - 5 - (maximo - valor_min) * escala
+            self.create_line(x, y_min + 1, x, y_max, fill=color)
+
+
 class AplicacionCarrera(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -164,24 +204,21 @@ class AplicacionCarrera(tk.Tk):
         muestra_frame = tk.Frame(info_container, bg=COLOR_PANEL, width=250)
         muestra_frame.pack(side="right", padx=10, fill="y")
         
-        tk.Label(
+        self.label_titulo_muestra = tk.Label(
             muestra_frame,
             text="Muestra del Arreglo",
             font=("Segoe UI", 9, "bold"),
             bg=COLOR_PANEL,
             fg=COLOR_TEXT_DIM
-        ).pack(pady=(5, 0))
+        )
+        self.label_titulo_muestra.pack(pady=(5, 0))
         
-        self.label_muestra = tk.Label(
+        self.visualizador = VisualizadorArreglo(
             muestra_frame,
-            text="[...]",
-            font=("Consolas", 8),
-            bg=COLOR_PANEL,
-            fg=COLOR_TEXT,
-            wraplength=230,
-            justify="left"
+            width=230,
+            height=80
         )
-        self.label_muestra.pack(pady=(0, 5), padx=10)
+        self.visualizador.pack(pady=(0, 5), padx=10)
         
         modo_frame = tk.Frame(self, bg=COLOR_PANEL, height=70)
         modo_frame.pack(fill="x", padx=20, pady=10)
@@ -357,11 +394,21 @@ class AplicacionCarrera(tk.Tk):
             self.barras[nombre] = barra
     
     def actualizar_muestra_arreglo(self):
-        if self.arreglo:
-            muestra = str(self.arreglo[:15])[1:-1]
-            if len(self.arreglo) > 15:
-                muestra += ", ..."
-            self.label_muestra.config(text=muestra)
+        self.label_titulo_muestra.config(text="Muestra del Arreglo")
+        self.visualizador.dibujar(self.arreglo)
+    
+    def refrescar_visualizacion(self):
+        # === REDIBUJO PERIÓDICO DESDE LAS INSTANTÁNEAS DE LA CARRERA ===
+        if not self.carrera:
+            return
+        
+        nombre, arr = self.carrera.obtener_instantanea()
+        if nombre:
+            self.label_titulo_muestra.config(text=f"Arreglo - {nombre}")
+            self.visualizador.dibujar(arr, COLORES_ALGORITMOS[nombre])
+        
+        if self.carrera.en_ejecucion:
+            self.after(INTERVALO_VISUALIZACION_MS, self.refrescar_visualizacion)
     
     def generar_nuevo_arreglo(self):
         self.arreglo = generar_arreglo(10000)
@@ -402,7 +449,8 @@ class AplicacionCarrera(tk.Tk):
             self.arreglo,
             callback_progreso=self.on_progreso,
             callback_completo=self.on_completo,
-            callback_progreso_tiempo_real=self.on_progreso_tiempo_real
+            callback_progreso_tiempo_real=self.on_progreso_tiempo_real,
+            backend=BackendEjecucion.mejor_disponible()
         )
         
         if self.modo_actual == "ordenamiento":
@@ -420,6 +468,9 @@ class AplicacionCarrera(tk.Tk):
         threading.Thread(target=self.animar_barras, daemon=True).start()
         
         self.carrera.iniciar_carrera()
+        
+        if self.modo_actual == "ordenamiento":
+            self.after(INTERVALO_VISUALIZACION_MS, self.refrescar_visualizacion)
     
     def animar_barras(self):
         velocidades = {
@@ -451,8 +502,12 @@ class AplicacionCarrera(tk.Tk):
         pass
     
     def on_progreso(self, nombre, tiempo, completados):
+        descalificado = nombre in self.carrera.descalificados
+        
         def update():
-            self.barras[nombre].actualizar(progreso=100, tiempo=tiempo, completado=True)
+            self.barras[nombre].actualizar(
+                progreso=100, tiempo=tiempo, completado=True, descalificado=descalificado
+            )
         
         self.after(0, update)
     
@@ -460,6 +515,9 @@ class AplicacionCarrera(tk.Tk):
         def update():
             self.animando = False
             
+            if self.modo_actual == "ordenamiento":
+                self.refrescar_visualizacion()
+            
             self.btn_iniciar.config(state="normal")
             self.btn_modo_orden.config(state="normal")
             self.btn_modo_busqueda.config(state="normal")
@@ -473,13 +531,22 @@ class AplicacionCarrera(tk.Tk):
                     text=f"GANADOR: {ganador} - {formatear_tiempo(tiempo)}",
                     fg=COLOR_SUCCESS
                 )
-                
+            
+            if resultados or self.carrera.descalificados:
                 tipo = "ORDENAMIENTO" if self.modo_actual == "ordenamiento" else "BÚSQUEDA"
                 mensaje = f"CLASIFICACIÓN FINAL - {tipo}:\n\n"
                 for i, (nombre, tiempo) in enumerate(resultados, 1):
                     medalla = ["1.", "2.", "3."][i-1] if i <= 3 else f"{i}."
                     mensaje += f"{medalla} {nombre}: {formatear_tiempo(tiempo)}\n"
                 
+                if self.carrera.descalificados:
+                    mensaje += "\nDESCALIFICADOS:\n"
+                    for nombre, motivo in self.carrera.descalificados.items():
+                        mensaje += f"✗ {nombre}: {motivo}\n"
+                
+                backends = ", ".join(sorted(set(self.carrera.obtener_backends().values())))
+                mensaje += f"\nBackend: {backends}"
+                mensaje += f"\nAceleración paralela: {self.carrera.aceleracion:.2f}x"
                 mensaje += f"\nMemoria consumida: {formatear_memoria(memoria_consumida)}"
                 
                 messagebox.showinfo("Resultados Finales", mensaje)
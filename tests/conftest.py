@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from algoritmos import BackendEjecucion
+
+# === PARÁMETROS DE LA SUITE ===
+TAMANIOS = [100, 1000]
+TAMANIOS_GRANDES = [10000]
+DISTRIBUCIONES = ["aleatoria", "ordenada", "invertida", "casi_ordenada", "pocos_unicos"]
+BACKENDS = [BackendEjecucion.HILOS, BackendEjecucion.SIN_GIL, BackendEjecucion.SUBINTERPRETES]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        help="Ejecuta los benchmarks; sin esta opción solo corren las pruebas de corrección"
+    )
+    parser.addoption(
+        "--tamanios-grandes",
+        action="store_true",
+        help="Incluye arreglos de 10,000 elementos (los O(n²) tardan varios segundos por ronda)"
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "tamanio" in metafunc.fixturenames:
+        tamanios = list(TAMANIOS)
+        if metafunc.config.getoption("--tamanios-grandes"):
+            tamanios += TAMANIOS_GRANDES
+        metafunc.parametrize("tamanio", tamanios)
+
+
+def pytest_collection_modifyitems(config, items):
+    # === BENCHMARKS FUERA DE LA EJECUCIÓN POR DEFECTO ===
+    if config.getoption("--benchmarks"):
+        return
+
+    benchmarks = [item for item in items if "benchmark" in getattr(item, "fixturenames", ())]
+    if benchmarks:
+        config.hook.pytest_deselected(items=benchmarks)
+        items[:] = [item for item in items if item not in benchmarks]
+
+
+def generar_distribucion(distribucion, tamanio, semilla=0):
+    # === ARREGLOS REPRODUCIBLES SEGÚN LA DISTRIBUCIÓN DE ENTRADA ===
+    generador = random.Random(semilla)
+    arr = [generador.randint(1, 100000) for _ in range(tamanio)]
+
+    if distribucion == "ordenada":
+        arr.sort()
+    elif distribucion == "invertida":
+        arr.sort(reverse=True)
+    elif distribucion == "casi_ordenada":
+        arr.sort()
+        for _ in range(max(1, tamanio // 100)):
+            i, j = generador.randrange(tamanio), generador.randrange(tamanio)
+            arr[i], arr[j] = arr[j], arr[i]
+    elif distribucion == "pocos_unicos":
+        arr = [generador.randint(1, 10) for _ in range(tamanio)]
+
+    return arr
+
+
+@pytest.fixture(params=DISTRIBUCIONES)
+def distribucion(request):
+    return request.param
+
+
+@pytest.fixture
+def datos(distribucion, tamanio):
+    return generar_distribucion(distribucion, tamanio)
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    if request.param not in BackendEjecucion.disponibles():
+        pytest.skip(f"Backend '{request.param}' no disponible en este intérprete")
+    return request.param
@@ -0,0 +1,76 @@
+import sys
+from functools import partial
+
+import pytest
+
+from algoritmos import (AlgoritmoOrdenamiento, AlgoritmoBusqueda, BackendEjecucion,
+                        InterpreterPoolExecutor, _cronometrar)
+from verificacion import VerificadorResultados
+
+ORDENAMIENTOS = {
+    "Burbuja": AlgoritmoOrdenamiento.burbuja,
+    "QuickSort": AlgoritmoOrdenamiento.quicksort,
+    "Inserción": AlgoritmoOrdenamiento.insercion,
+}
+
+BUSQUEDAS = {
+    "Búsqueda Secuencial": AlgoritmoBusqueda.busqueda_secuencial,
+    "Búsqueda Binaria": AlgoritmoBusqueda.busqueda_binaria,
+}
+
+POSICIONES = ["inicio", "medio", "final", "ausente"]
+
+
+def medir_competidor(benchmark, funcion, arr, backend):
+    # === MIDE SOLO LA LLAMADA AL ALGORITMO EN EL BACKEND PEDIDO ===
+    benchmark.extra_info["backend"] = backend
+
+    if backend != BackendEjecucion.SUBINTERPRETES:
+        # hilos y sin_gil ejecutan la función tal cual dentro del hilo del competidor
+        return benchmark(funcion, arr)
+
+    # El intérprete se crea y se calienta fuera de la medición; queda el costo
+    # de enviar el arreglo y devolver el resultado, propio de este backend
+    with InterpreterPoolExecutor(max_workers=1) as pool:
+        pool.submit(_cronometrar, funcion, arr).result()
+        resultado, inicio, fin, _ = benchmark(lambda: pool.submit(_cronometrar, funcion, arr).result())
+
+    benchmark.extra_info["tiempo_interno"] = fin - inicio
+    return resultado
+
+
+@pytest.mark.parametrize("competidor", list(ORDENAMIENTOS))
+def test_benchmark_ordenamiento(benchmark, competidor, distribucion, tamanio, datos, backend):
+    # El pivote al final hace que QuickSort recurra n niveles en entradas casi ordenadas,
+    # y aquí corre sobre la pila de pytest, que ya ocupa parte del límite
+    if (competidor == "QuickSort" and distribucion in ("ordenada", "invertida", "casi_ordenada")
+            and tamanio >= sys.getrecursionlimit() // 2):
+        pytest.skip("QuickSort excede el límite de recursión en entradas ordenadas de este tamaño")
+
+    benchmark.group = f"ordenamiento-{distribucion}-{tamanio}"
+    resultado = medir_competidor(benchmark, ORDENAMIENTOS[competidor], datos, backend)
+
+    valido, mensaje = VerificadorResultados.para_ordenamiento(datos)(resultado)
+    assert valido, mensaje
+
+
+@pytest.mark.parametrize("posicion", POSICIONES)
+@pytest.mark.parametrize("competidor", list(BUSQUEDAS))
+def test_benchmark_busqueda(benchmark, competidor, posicion, distribucion, tamanio, datos, backend):
+    arr_ordenado = sorted(datos)
+    objetivos = {
+        "inicio": arr_ordenado[0],
+        "medio": arr_ordenado[len(arr_ordenado) // 2],
+        "final": arr_ordenado[-1],
+        "ausente": arr_ordenado[-1] + 1,
+    }
+    objetivo = objetivos[posicion]
+
+    # partial en lugar de un closure para que también viaje a un subintérprete
+    funcion = partial(BUSQUEDAS[competidor], objetivo=objetivo)
+
+    benchmark.group = f"busqueda-{posicion}-{distribucion}-{tamanio}"
+    resultado = medir_competidor(benchmark, funcion, arr_ordenado, backend)
+
+    valido, mensaje = VerificadorResultados.para_busqueda(arr_ordenado, objetivo)(resultado)
+    assert valido, mensaje
@@ -0,0 +1,47 @@
+import sys
+import threading
+
+import pytest
+
+from carrera import CarreraAlgoritmos
+
+
+def correr_carrera(arreglo, backend, **opciones):
+    # === CARRERA COMPLETA SIN INTERFAZ ===
+    terminada = threading.Event()
+    carrera = CarreraAlgoritmos(
+        arreglo,
+        callback_completo=lambda resultados, memoria: terminada.set(),
+        backend=backend
+    )
+    carrera.preparar_carrera(**opciones)
+    carrera.iniciar_carrera()
+    terminada.wait()
+    return carrera
+
+
+def test_benchmark_carrera_ordenamiento(benchmark, distribucion, tamanio, datos, backend):
+    if distribucion in ("ordenada", "invertida", "casi_ordenada") and tamanio > sys.getrecursionlimit():
+        pytest.skip("QuickSort excede el límite de recursión en entradas ordenadas de este tamaño")
+
+    benchmark.group = f"carrera-ordenamiento-{distribucion}-{tamanio}"
+    carrera = benchmark(correr_carrera, datos, backend)
+
+    benchmark.extra_info["backends"] = carrera.obtener_backends()
+    benchmark.extra_info["aceleracion"] = carrera.aceleracion
+
+    assert not carrera.descalificados
+    assert len(carrera.obtener_clasificacion()) == 3
+
+
+@pytest.mark.parametrize("distribucion", ["aleatoria"])
+def test_benchmark_carrera_busqueda(benchmark, distribucion, tamanio, datos, backend):
+    objetivo = datos[len(datos) // 2]
+
+    benchmark.group = f"carrera-busqueda-{distribucion}-{tamanio}"
+    carrera = benchmark(correr_carrera, datos, backend, objetivo_busqueda=objetivo, solo_busqueda=True)
+
+    benchmark.extra_info["backends"] = carrera.obtener_backends()
+
+    assert not carrera.descalificados
+    assert len(carrera.obtener_clasificacion()) == 2
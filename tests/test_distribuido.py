@@ -0,0 +1,181 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from multiprocessing.connection import Client
+
+import pytest
+
+from distribuido import CoordinadorCarrera, _ClienteEstado, _EstadoCoordinador, iniciar_trabajadores_locales
+
+# Mayor que el intervalo de latido de los trabajadores (1 s) para no perder trabajadores sanos
+LIMITE_LATIDO = 2.5
+
+
+@pytest.fixture
+def coordinador():
+    coord = CoordinadorCarrera(limite_latido=LIMITE_LATIDO)
+    coord.iniciar()
+    yield coord
+    coord.detener()
+
+
+def _terminar(procesos):
+    for proceso in procesos:
+        proceso.join(timeout=5)
+        if proceso.is_alive():
+            proceso.kill()
+
+
+def test_reasigna_trabajos_de_un_trabajador_caido(coordinador):
+    # Un trabajo largo para poder matar a quien lo tome a mitad de ejecución
+    ids = [coordinador.agregar_trabajo("Burbuja", 4000, 9)]
+    ids += coordinador.agregar_barrido(["QuickSort", "Búsqueda Binaria"], [200, 500], [1, 2])
+
+    procesos = iniciar_trabajadores_locales(coordinador.direccion, coordinador.clave, cantidad=3)
+    try:
+        limite = time.monotonic() + 10
+        while ids[0] not in coordinador.estado.en_curso:
+            assert time.monotonic() < limite, "Ningún trabajador tomó el trabajo largo"
+            time.sleep(0.005)
+
+        caido, _ = coordinador.estado.en_curso[ids[0]]
+        os.kill(procesos[int(caido.split("-")[1])].pid, signal.SIGKILL)
+
+        resultados = coordinador.esperar_resultados(timeout=60)
+        coordinador.detener()
+    finally:
+        _terminar(procesos)
+
+    assert sorted(r["id"] for r in resultados) == sorted(ids)
+    assert all(r["verificado"] for r in resultados)
+    assert caido in coordinador.trabajadores_perdidos
+    assert all(r["trabajador"] != caido for r in resultados if r["id"] == ids[0])
+
+
+def test_trabajo_defectuoso_no_tumba_al_trabajador(coordinador):
+    # Se salta la validación de agregar_trabajo para simular un trabajo defectuoso
+    coordinador.estado.agregar({"id": 100, "competidor": "Búsqueda Binaria", "tamanio": 0, "semilla": 1})
+    coordinador.agregar_trabajo("QuickSort", 100, 1)
+
+    procesos = iniciar_trabajadores_locales(coordinador.direccion, coordinador.clave, cantidad=1)
+    try:
+        resultados = coordinador.esperar_resultados(timeout=30)
+        coordinador.detener()
+    finally:
+        _terminar(procesos)
+
+    por_id = {r["id"]: r for r in resultados}
+    assert not por_id[100]["verificado"]
+    assert "Error" in por_id[100]["mensaje"]
+    assert por_id[0]["verificado"]
+    assert not coordinador.trabajadores_perdidos
+
+
+def test_trabajo_que_tumba_trabajadores_se_abandona():
+    estado = _EstadoCoordinador(max_intentos=3)
+    estado.agregar({"id": 0, "competidor": "Burbuja", "tamanio": 10, "semilla": 1})
+
+    for trabajador in ("a", "b", "c"):
+        assert estado.tomar(trabajador)["id"] == 0
+        time.sleep(0.01)
+        assert estado.revisar_perdidos(0) == [trabajador]
+
+    assert estado.trabajos_restantes() == 0
+    [resultado] = estado.obtener_resultados()
+    assert resultado["id"] == 0
+    assert not resultado["verificado"]
+    assert "Abandonado" in resultado["mensaje"]
+
+    # Una entrega tardía del mismo trabajo no lo duplica
+    estado.entregar("a", dict(resultado, verificado=True))
+    assert len(estado.obtener_resultados()) == 1
+
+
+def test_esperar_resultados_termina_sin_trabajadores():
+    coord = CoordinadorCarrera(limite_latido=0.2)
+    coord.iniciar()
+    try:
+        coord.agregar_trabajo("QuickSort", 100, 1)
+        avisos = []
+        inicio = time.monotonic()
+        coord.esperar_resultados(espera_sin_trabajadores=0.5, callback_aviso=avisos.append, timeout=10)
+        transcurrido = time.monotonic() - inicio
+    finally:
+        coord.detener()
+
+    assert transcurrido < 5
+    assert coord.estado.trabajos_restantes() == 1
+    assert len(avisos) == 1
+
+
+def test_agregar_trabajo_rechaza_tamanio_invalido(coordinador):
+    with pytest.raises(ValueError):
+        coordinador.agregar_trabajo("Burbuja", 0, 1)
+    with pytest.raises(ValueError):
+        coordinador.agregar_trabajo("Desconocido", 10, 1)
+
+
+def test_coordinadores_en_el_mismo_proceso_no_comparten_estado(coordinador):
+    coordinador.agregar_trabajo("QuickSort", 100, 1)
+    otro = CoordinadorCarrera()
+    otro.iniciar()
+    try:
+        procesos = iniciar_trabajadores_locales(coordinador.direccion, coordinador.clave, cantidad=1)
+        try:
+            resultados = coordinador.esperar_resultados(timeout=30)
+            coordinador.detener()
+        finally:
+            _terminar(procesos)
+    finally:
+        otro.detener()
+
+    assert [r["id"] for r in resultados] == [0]
+    assert otro.estado.obtener_resultados() == []
+
+
+def test_servidor_solo_expone_los_metodos_de_los_trabajadores(coordinador):
+    # Una clave incorrecta se rechaza sin detener el bucle de aceptación
+    with pytest.raises(multiprocessing.AuthenticationError):
+        Client(coordinador.direccion, authkey=b"otra")
+
+    cliente = _ClienteEstado(coordinador.direccion, coordinador.clave)
+    try:
+        cliente.registrar("prueba")
+        assert "prueba" in coordinador.estado.trabajadores_activos()
+
+        cliente.conexion.send(("detener", ()))
+        assert cliente.conexion.recv()[0] is False
+        assert not coordinador.estado.esta_detenido()
+    finally:
+        cliente.cerrar()
+
+
+def test_detener_desconecta_a_los_trabajadores(coordinador):
+    cliente = _ClienteEstado(coordinador.direccion, coordinador.clave)
+    try:
+        assert not cliente.esta_detenido()
+        coordinador.detener()
+        with pytest.raises((EOFError, OSError)):
+            for _ in range(10):
+                cliente.esta_detenido()
+                time.sleep(0.1)
+    finally:
+        cliente.cerrar()
+
+
+def test_detener_libera_el_puerto():
+    coord = CoordinadorCarrera()
+    coord.iniciar()
+    hilo = coord.hilo_servidor
+    coord.detener()
+
+    assert not hilo.is_alive()
+    with pytest.raises(ConnectionRefusedError):
+        socket.create_connection(coord.direccion, timeout=1)
+
+    # El mismo puerto queda disponible para un coordinador nuevo
+    nuevo = CoordinadorCarrera(direccion=coord.direccion)
+    nuevo.iniciar()
+    nuevo.detener()
@@ -0,0 +1,225 @@
+import random
+import threading
+from functools import partial
+
+import algoritmos
+
+import pytest
+
+from algoritmos import (AlgoritmoOrdenamiento, AlgoritmoBusqueda, BackendEjecucion, EjecutorAlgoritmo,
+                        InstantaneaArreglo, _es_transferible)
+from carrera import CarreraAlgoritmos
+from utils import generar_arreglo
+from verificacion import VerificadorResultados
+from visualizacion import ResumenCubetas
+
+ORDENAMIENTOS = [
+    AlgoritmoOrdenamiento.burbuja,
+    AlgoritmoOrdenamiento.quicksort,
+    AlgoritmoOrdenamiento.insercion,
+]
+
+BUSQUEDAS = [
+    AlgoritmoBusqueda.busqueda_secuencial,
+    AlgoritmoBusqueda.busqueda_binaria,
+]
+
+CASOS_BORDE = [[], [1], [2, 1], [5, 5, 5, 5], [1, 2, 3, 4], [4, 3, 2, 1], [-3, 0, -3, 7]]
+
+
+@pytest.mark.parametrize("semilla", range(20))
+@pytest.mark.parametrize("ordenar", ORDENAMIENTOS)
+def test_ordenamiento_coincide_con_sorted(ordenar, semilla):
+    generador = random.Random(semilla)
+    arr = [generador.randint(-50, 50) for _ in range(generador.randint(0, 200))]
+    original = list(arr)
+
+    assert ordenar(arr) == sorted(original)
+    assert arr == original
+
+
+@pytest.mark.parametrize("arr", CASOS_BORDE)
+@pytest.mark.parametrize("ordenar", ORDENAMIENTOS)
+def test_ordenamiento_casos_borde(ordenar, arr):
+    assert ordenar(arr) == sorted(arr)
+
+
+@pytest.mark.parametrize("semilla", range(20))
+@pytest.mark.parametrize("buscar", BUSQUEDAS)
+def test_busqueda_devuelve_indice_valido(buscar, semilla):
+    generador = random.Random(semilla)
+    arr = sorted(generador.randint(0, 100) for _ in range(generador.randint(0, 100)))
+    objetivo = generador.randint(-10, 110)
+
+    indice = buscar(arr, objetivo)
+
+    assert VerificadorResultados.indice_valido(arr, objetivo, indice)
+    assert (indice != -1) == (objetivo in arr)
+
+
+def test_verificador_rechaza_resultados_incorrectos():
+    arr = [3, 1, 2, 2]
+    verificar = VerificadorResultados.para_ordenamiento(arr)
+
+    assert verificar([1, 2, 2, 3])[0]
+    assert not verificar([1, 2, 3, 2])[0]
+    assert not verificar([1, 2, 3])[0]
+    assert not verificar([1, 2, 3, 3])[0]
+    assert not verificar(None)[0]
+
+    # Valores distintos que hash() de CPython hace coincidir
+    assert not VerificadorResultados.para_ordenamiento([-1, 5, 7])([-2, 5, 7])[0]
+    assert not VerificadorResultados.para_ordenamiento([1, 5])([1.0, 5])[0]
+    assert not VerificadorResultados.para_ordenamiento([1, 5])([True, 5])[0]
+    assert not VerificadorResultados.para_ordenamiento([0, 5])([0 + (1 << 61) - 1, 5])[0]
+
+    verificar_busqueda = VerificadorResultados.para_busqueda([1, 2, 3], 2)
+    assert verificar_busqueda(1)[0]
+    assert not verificar_busqueda(0)[0]
+    assert not verificar_busqueda(-1)[0]
+    assert not verificar_busqueda(None)[0]
+
+
+def test_generar_arreglo_reproducible_con_semilla():
+    assert generar_arreglo(50, semilla=7) == generar_arreglo(50, semilla=7)
+    assert generar_arreglo(50, semilla=7) != generar_arreglo(50, semilla=8)
+
+
+@pytest.mark.parametrize("longitud", [1, 10, 1000, 100000])
+def test_resumen_cubetas_acota_valores(longitud):
+    arr = generar_arreglo(longitud, semilla=longitud)
+    resumen = ResumenCubetas(num_cubetas=50, muestras_por_cubeta=8)
+    resumen.actualizar(arr)
+
+    assert len(resumen.minimos) == min(50, longitud)
+    assert all(mn <= mx for mn, mx in zip(resumen.minimos, resumen.maximos))
+    assert min(arr) <= resumen.rango()[0] <= resumen.rango()[1] <= max(arr)
+
+
+def test_resumen_cubetas_converge_al_minimo_y_maximo_exactos():
+    arr = generar_arreglo(1000, semilla=3)
+    resumen = ResumenCubetas(num_cubetas=10, muestras_por_cubeta=16)
+
+    # 100 elementos por cubeta a 16 lecturas por actualización: 7 actualizaciones
+    for _ in range(7):
+        resumen.actualizar(arr)
+
+    assert resumen.minimos == [min(arr[b * 100:(b + 1) * 100]) for b in range(10)]
+    assert resumen.maximos == [max(arr[b * 100:(b + 1) * 100]) for b in range(10)]
+
+
+def test_ejecutor_retrocede_a_hilos_si_no_puede_transferir():
+    ejecutor = EjecutorAlgoritmo(
+        "Cierre", lambda arr: sorted(arr), [3, 1, 2], backend=BackendEjecucion.SUBINTERPRETES
+    )
+    ejecutor.ejecutar()
+    ejecutor.esperar()
+
+    assert ejecutor.backend == BackendEjecucion.HILOS
+    assert ejecutor.resultado == [1, 2, 3]
+
+
+def test_ejecutor_retrocede_a_hilos_si_falla_el_subinterprete(monkeypatch):
+    class PoolQueFalla:
+        def __init__(self, max_workers):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *excepcion):
+            return False
+
+        def submit(self, funcion, *args):
+            raise RuntimeError("no se pudo importar algoritmos en el subintérprete")
+
+    monkeypatch.setattr(algoritmos, "InterpreterPoolExecutor", PoolQueFalla)
+
+    ejecutor = EjecutorAlgoritmo(
+        "QuickSort", AlgoritmoOrdenamiento.quicksort, [3, 1, 2], backend=BackendEjecucion.SUBINTERPRETES
+    )
+    assert ejecutor.backend == BackendEjecucion.SUBINTERPRETES
+
+    ejecutor.ejecutar()
+    ejecutor.esperar()
+
+    assert ejecutor.completado
+    assert ejecutor.backend == BackendEjecucion.HILOS
+    assert ejecutor.resultado == [1, 2, 3]
+
+
+def test_competidor_con_instantanea_no_se_transfiere():
+    con_instantanea = partial(AlgoritmoOrdenamiento.burbuja, instantanea=InstantaneaArreglo())
+
+    assert not _es_transferible(con_instantanea)
+    assert _es_transferible(AlgoritmoOrdenamiento.burbuja)
+    assert EjecutorAlgoritmo(
+        "Burbuja", con_instantanea, [2, 1], backend=BackendEjecucion.SUBINTERPRETES
+    ).backend == BackendEjecucion.HILOS
+
+
+@pytest.mark.skipif(not BackendEjecucion.subinterpretes_disponibles(),
+                    reason="InterpreterPoolExecutor requiere Python 3.14+")
+@pytest.mark.parametrize("funcion, arr, esperado", [
+    (AlgoritmoOrdenamiento.quicksort, [5, 3, 9, 1, 3], [1, 3, 3, 5, 9]),
+    (partial(AlgoritmoBusqueda.busqueda_binaria, objetivo=9), [1, 3, 5, 9], 3),
+])
+def test_ejecutor_corre_en_subinterprete(funcion, arr, esperado):
+    ejecutor = EjecutorAlgoritmo("Competidor", funcion, arr, backend=BackendEjecucion.SUBINTERPRETES)
+    ejecutor.ejecutar()
+    ejecutor.esperar()
+
+    assert ejecutor.backend == BackendEjecucion.SUBINTERPRETES
+    assert ejecutor.completado
+    assert ejecutor.resultado == esperado
+    assert ejecutor.fin >= ejecutor.inicio
+
+
+@pytest.mark.skipif(not BackendEjecucion.gil_desactivado(),
+                    reason="Requiere un CPython free-threaded con el GIL desactivado")
+def test_ejecutor_corre_sin_gil():
+    ejecutor = EjecutorAlgoritmo(
+        "QuickSort", AlgoritmoOrdenamiento.quicksort, [3, 1, 2], backend=BackendEjecucion.SIN_GIL
+    )
+    ejecutor.ejecutar()
+    ejecutor.esperar()
+
+    assert ejecutor.backend == BackendEjecucion.SIN_GIL
+    assert ejecutor.resultado == [1, 2, 3]
+
+
+@pytest.mark.parametrize("backend, comparte_instantanea", [
+    (BackendEjecucion.HILOS, True),
+    (BackendEjecucion.SUBINTERPRETES, False),
+])
+def test_carrera_solo_comparte_instantaneas_en_el_mismo_interprete(monkeypatch, backend, comparte_instantanea):
+    # Simula un intérprete donde el backend pedido está disponible
+    monkeypatch.setattr(BackendEjecucion, "resolver", staticmethod(lambda solicitado: solicitado))
+
+    carrera = CarreraAlgoritmos([3, 1, 2], backend=backend)
+    carrera.preparar_carrera()
+
+    for ejecutor in carrera.ejecutores:
+        assert ejecutor.backend == backend
+        if ejecutor.nombre in ("Burbuja", "Inserción"):
+            assert isinstance(ejecutor.funcion, partial) == comparte_instantanea
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_aceleracion_ignora_competidores_que_fallaron():
+    def falla(arr):
+        raise RuntimeError("competidor roto")
+
+    terminada = threading.Event()
+    carrera = CarreraAlgoritmos(
+        generar_arreglo(300, semilla=1),
+        callback_completo=lambda resultados, memoria: terminada.set()
+    )
+    carrera.preparar_carrera()
+    carrera.ejecutores[0].funcion = falla
+    carrera.iniciar_carrera()
+    assert terminada.wait(30)
+
+    assert not carrera.ejecutores[0].completado
+    assert 0 < carrera.tiempo_total < 30
+    assert carrera.aceleracion > 0.1
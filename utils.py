@@ -2,9 +2,11 @@ import psutil
 import os
 import random
 
-def generar_arreglo(tamanio=10000, min_val=1, max_val=100000):
+def generar_arreglo(tamanio=10000, min_val=1, max_val=100000, semilla=None):
     # === GENERACIÓN DE ARREGLO ALEATORIO ===
-    return [random.randint(min_val, max_val) for _ in range(tamanio)]
+    # Con semilla el arreglo es reproducible en cualquier máquina
+    generador = random if semilla is None else random.Random(semilla)
+    return [generador.randint(min_val, max_val) for _ in range(tamanio)]
 
 
 def obtener_uso_memoria():
@@ -0,0 +1,70 @@
+import hashlib
+import os
+from itertools import islice
+
+# === MÓDULO PRIMO PARA LA HUELLA DEL MULTICONJUNTO ===
+MODULO_HUELLA = (1 << 127) - 1
+
+
+class VerificadorResultados:
+    # === COMPROBACIONES BARATAS DE CORRECCIÓN ===
+
+    @staticmethod
+    def esta_ordenado(arr):
+        # Recorrido O(n) comparando pares adyacentes
+        return all(a <= b for a, b in zip(arr, islice(arr, 1, None)))
+
+    @staticmethod
+    def codificar(x, clave):
+        # Tipo + repr distingue valores que hash() confunde (-1 y -2, 1 y 1.0 y True);
+        # la clave secreta impide fabricar colisiones a propósito
+        texto = f"{type(x).__qualname__}:{x!r}".encode()
+        return int.from_bytes(hashlib.blake2b(texto, key=clave, digest_size=16).digest(), "little")
+
+    @staticmethod
+    def huella(arr, clave):
+        # Huella conmutativa del multiconjunto: no depende del orden,
+        # así que evita ordenar otra vez la entrada para compararla
+        suma = 0
+        suma_cuadrados = 0
+        for x in arr:
+            h = VerificadorResultados.codificar(x, clave)
+            suma += h
+            suma_cuadrados += h * h
+        return len(arr), suma % MODULO_HUELLA, suma_cuadrados % MODULO_HUELLA
+
+    @staticmethod
+    def indice_valido(arr, objetivo, indice):
+        if indice == -1:
+            return objetivo not in arr
+        return 0 <= indice < len(arr) and arr[indice] == objetivo
+
+    @staticmethod
+    def para_ordenamiento(arr_original):
+        # === VERIFICADOR DE ORDENAMIENTO ===
+        # La huella de la entrada se calcula aquí, antes de la carrera
+        clave = os.urandom(16)
+        huella_original = VerificadorResultados.huella(arr_original, clave)
+
+        def verificar(resultado):
+            if resultado is None:
+                return False, "Sin resultado"
+            if not VerificadorResultados.esta_ordenado(resultado):
+                return False, "El resultado no está ordenado"
+            if VerificadorResultados.huella(resultado, clave) != huella_original:
+                return False, "El resultado no contiene los mismos elementos"
+            return True, "Correcto"
+
+        return verificar
+
+    @staticmethod
+    def para_busqueda(arr, objetivo):
+        # === VERIFICADOR DE BÚSQUEDA ===
+        def verificar(resultado):
+            if not isinstance(resultado, int):
+                return False, "Índice inválido"
+            if not VerificadorResultados.indice_valido(arr, objetivo, resultado):
+                return False, f"Índice incorrecto: {resultado}"
+            return True, "Correcto"
+
+        return verificar
@@ -0,0 +1,71 @@
+class ResumenCubetas:
+    # === RESUMEN MÍNIMO/MÁXIMO POR CUBETAS CON COSTO CONSTANTE ===
+    # Cada actualización lee a lo sumo num_cubetas * muestras_por_cubeta posiciones,
+    # sin importar el tamaño del arreglo, y nunca lo copia entero
+
+    def __init__(self, num_cubetas=100, muestras_por_cubeta=64):
+        self.num_cubetas = num_cubetas
+        self.muestras_por_cubeta = muestras_por_cubeta
+        self.minimos = []
+        self.maximos = []
+        self.tamanio = 0
+        self.arr = None
+        self.limites = []
+        self.cursores = []
+        self.parciales = []
+        self.completos = []
+
+    def _reiniciar(self, arr):
+        n = len(arr)
+        cubetas = min(self.num_cubetas, n)
+
+        self.arr = arr
+        self.tamanio = n
+        self.limites = [(b * n // cubetas, (b + 1) * n // cubetas) for b in range(cubetas)]
+        self.cursores = [inicio for inicio, _ in self.limites]
+        self.parciales = [None] * cubetas
+        self.completos = [None] * cubetas
+
+    def actualizar(self, arr):
+        # === AVANCE INCREMENTAL DEL RECORRIDO DE CADA CUBETA ===
+        # Cada cubeta lee el siguiente tramo contiguo y acumula su mínimo y máximo;
+        # al llegar al final de la cubeta, ese rango pasa a ser el de la pasada completa
+        if arr is not self.arr or len(arr) != self.tamanio:
+            self._reiniciar(arr)
+
+        minimos = []
+        maximos = []
+        for b, (inicio, fin) in enumerate(self.limites):
+            cursor = self.cursores[b]
+            tramo = arr[cursor:min(cursor + self.muestras_por_cubeta, fin)]
+            minimo, maximo = min(tramo), max(tramo)
+
+            if self.parciales[b] is not None:
+                minimo = min(minimo, self.parciales[b][0])
+                maximo = max(maximo, self.parciales[b][1])
+
+            cursor += len(tramo)
+            if cursor >= fin:
+                self.completos[b] = (minimo, maximo)
+                self.parciales[b] = None
+                cursor = inicio
+            else:
+                self.parciales[b] = (minimo, maximo)
+            self.cursores[b] = cursor
+
+            # Se muestra la última pasada completa ampliada con lo leído en la actual;
+            # hasta completar la primera, solo el rango de lo leído
+            minimo, maximo = self.completos[b] or self.parciales[b]
+            if self.completos[b] is not None and self.parciales[b] is not None:
+                minimo = min(minimo, self.parciales[b][0])
+                maximo = max(maximo, self.parciales[b][1])
+            minimos.append(minimo)
+            maximos.append(maximo)
+
+        self.minimos = minimos
+        self.maximos = maximos
+
+    def rango(self):
+        if not self.minimos:
+            return None
+        return min(self.minimos), max(self.maximos)